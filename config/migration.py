@@ -4,13 +4,14 @@ Handles automatic migration of configuration files across application versions.
 """
 
 import json
-import re
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from core.utils import PAIR_RE
+
 
 class ConfigVersion(Enum):
     """
@@ -266,7 +267,7 @@ class ConfigValidator:
             if not isinstance(pair, str):
                 return False, f"Invalid pair type: {pair} (must be string)"
 
-            if not re.match(r"^[A-Z0-9]+-[A-Z0-9]+$", pair):
+            if not PAIR_RE.match(pair):
                 return False, f"Invalid pair format: {pair} (must be like BTC-USDT)"
 
         return True, ""
@@ -394,6 +394,29 @@ class SettingsManager:
         self.settings.price_change_basis = basis
         self.save()
 
+    def update_many(self, values: dict[str, Any]) -> set[str]:
+        """
+        Apply several settings at once and save them with a single write.
+
+        Args:
+            values: New values keyed by AppSettings field name
+
+        Returns:
+            Names of the fields whose value actually changed
+        """
+        changed = {key for key, value in values.items() if getattr(self.settings, key) != value}
+        if not changed:
+            return changed
+
+        for key in changed:
+            setattr(self.settings, key, values[key])
+        if "language" in changed:
+            load_language(self.settings.language)
+        if "proxy" in changed:
+            self._apply_proxy_env()
+        self.save()
+        return changed
+
     # Alert management methods
     def add_alert(self, alert: PriceAlert) -> None:
         """Add a new price alert."""
@@ -502,9 +525,17 @@ class SettingsManager:
         self.save()
         logger.info("✅ Configuration reset to defaults")
 
-    def export_to_file(self, filepath: str) -> None:
-        """Export settings to a specific file."""
-        data = asdict(self.settings)
+    def export_to_file(self, filepath: str, data: dict[str, Any] | None = None) -> None:
+        """
+        Export settings to a specific file.
+
+        Args:
+            filepath: Destination JSON file
+            data: Snapshot from asdict(settings) taken earlier, so the file can be
+                written from a worker thread; defaults to the current settings
+        """
+        if data is None:
+            data = asdict(self.settings)
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
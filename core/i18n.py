@@ -96,12 +96,16 @@ class Translations:
                     except Exception:
                         pass
 
+        # Drop empty or non-string entries once, so lookups are a plain dict hit
+        self._translations = {
+            key: val
+            for key, val in self._translations.items()
+            if isinstance(val, str) and val.strip()
+        }
+
     def get(self, key: str) -> str:
         """Get translation for key. Returns key if translation is missing or empty."""
-        val = self._translations.get(key)
-        if val and isinstance(val, str) and val.strip():
-            return val
-        return key
+        return self._translations.get(key, key)
 
     def get_current_language(self) -> str:
         return self._current_lang
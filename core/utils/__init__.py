@@ -3,8 +3,12 @@ Utility functions for Crypto Monitor.
 """
 
 import os
+import re
 from contextlib import contextmanager
 
+# Exchange pair format, e.g. "BTC-USDT"
+PAIR_RE = re.compile(r"^[A-Z0-9]+-[A-Z0-9]+$")
+
 
 @contextmanager
 def suppress_output():
@@ -8,6 +8,7 @@ import os
 import sys
 
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QApplication
 
 from config.settings import get_settings_manager
@@ -29,6 +30,8 @@ def main():
 
     app = QApplication(sys.argv)
     app.setApplicationName("Crypto Monitor")
+    # Loaded once; every top-level window inherits the application icon
+    app.setWindowIcon(QIcon("assets/icons/crypto-monitor.png"))
 
     from core.version import __version__
 
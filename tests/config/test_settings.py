@@ -1,5 +1,6 @@
 import json
 import os
+from dataclasses import asdict
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -88,6 +89,43 @@ class TestSettingsManager:
             assert "HTTP_PROXY" in os.environ
             assert "http://1.2.3.4:8080" in os.environ["HTTP_PROXY"]
 
+    def test_update_many_saves_once_and_reports_changes(self, settings_manager):
+        settings_manager.settings.theme_mode = "light"
+        settings_manager.settings.display_limit = 3
+
+        with patch.object(settings_manager, "save") as save:
+            changed = settings_manager.update_many({"theme_mode": "dark", "display_limit": 3})
+
+        assert changed == {"theme_mode"}
+        assert settings_manager.settings.theme_mode == "dark"
+        save.assert_called_once()
+
+    def test_update_many_skips_save_when_unchanged(self, settings_manager):
+        values = {"data_source": settings_manager.settings.data_source, "proxy": ProxyConfig()}
+
+        with patch.object(settings_manager, "save") as save:
+            assert settings_manager.update_many(values) == set()
+
+        save.assert_not_called()
+
+    def test_update_many_applies_proxy_env(self, settings_manager):
+        proxy = ProxyConfig(enabled=True, host="1.2.3.4", port=8080)
+
+        with patch.dict("os.environ", clear=True):
+            settings_manager.update_many({"proxy": proxy})
+
+            assert "http://1.2.3.4:8080" in os.environ["HTTP_PROXY"]
+
+    def test_export_to_file_writes_given_snapshot(self, settings_manager, tmp_path):
+        snapshot = asdict(settings_manager.settings)
+        settings_manager.settings.data_source = "Binance"
+        target = tmp_path / "export.json"
+
+        settings_manager.export_to_file(str(target), snapshot)
+
+        with open(target, encoding="utf-8") as f:
+            assert json.load(f)["data_source"] == snapshot["data_source"] != "Binance"
+
     def test_partial_config_load(self, settings_manager):
         partial_data = {
             "data_source": "Binance",
@@ -0,0 +1,25 @@
+import json
+
+from core import i18n
+from core.i18n import Translations
+
+
+def test_blank_translations_fall_back_to_key(tmp_path, monkeypatch):
+    (tmp_path / "i18n").mkdir()
+    (tmp_path / "i18n" / "de_DE.json").write_text(
+        json.dumps({"Save": "Speichern", "About": "", "Network": "   ", "Count": 3}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(i18n, "__file__", str(tmp_path / "core" / "i18n.py"))
+
+    translator = Translations()
+    # Translations is a singleton; let monkeypatch restore its loaded state afterwards
+    monkeypatch.setattr(translator, "_translations", {})
+    monkeypatch.setattr(translator, "_current_lang", translator.get_current_language())
+    translator.load_language("de_DE")
+
+    assert translator.get("Save") == "Speichern"
+    assert translator.get("About") == "About"
+    assert translator.get("Network") == "Network"
+    assert translator.get("Count") == "Count"
+    assert translator.get("Missing") == "Missing"
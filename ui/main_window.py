@@ -6,7 +6,7 @@ import logging
 import webbrowser
 
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QIcon, QMouseEvent
+from PyQt6.QtGui import QMouseEvent
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -83,7 +83,6 @@ class MainWindow(QMainWindow):
         self.setWindowFlags(flags)
 
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setWindowIcon(QIcon("assets/icons/crypto-monitor.png"))
         self.setWindowTitle(_("Crypto Monitor"))
 
         # Move to saved position
@@ -180,20 +179,16 @@ class MainWindow(QMainWindow):
 
     def _open_settings(self):
         """Open settings window."""
-        if self._settings_window is None or not self._settings_window.isVisible():
+        if self._settings_window is None:
             self._settings_window = SettingsWindow(self._settings_manager)
-            self._settings_window.proxy_changed.connect(self._on_proxy_changed)
-            self._settings_window.pairs_changed.connect(self._on_pairs_changed)
-            self._settings_window.theme_changed.connect(self._on_theme_changed)
-            self._settings_window.data_source_changed.connect(self._on_data_source_changed)
-            self._settings_window.display_changed.connect(self._on_display_changed)
-            self._settings_window.auto_scroll_changed.connect(self._on_auto_scroll_changed)
-            self._settings_window.display_limit_changed.connect(self._on_display_limit_changed)
-            self._settings_window.minimalist_view_changed.connect(self._on_minimalist_view_changed)
-            self._settings_window.price_change_basis_changed.connect(self._on_data_source_changed)
-            self._settings_window.show()
-        else:
-            self._settings_window.raise_()
+            self._settings_window.settings_changed.connect(
+                self._on_settings_changed, Qt.ConnectionType.QueuedConnection
+            )
+        elif not self._settings_window.isVisible():
+            self._settings_window.reload()
+        self._settings_window.show()
+        self._settings_window.raise_()
+        self._settings_window.activateWindow()
 
     def _on_page_changed(self, page: int):
         """Handle page change."""
@@ -210,25 +205,35 @@ class MainWindow(QMainWindow):
         for card in self._cards.values():
             card.set_connection_state(state)
 
-    def _on_proxy_changed(self):
-        self._market_controller.set_proxy()
+    def _on_settings_changed(self, changed: set):
+        """Apply a batch of settings saved in the settings window."""
+        settings = self._settings_manager.settings
 
-    def _on_pairs_changed(self):
-        self._load_pairs()
+        # Switching clients reconnects with the current proxy, so one reconnect covers both
+        if "data_source" in changed or "price_change_basis" in changed:
+            self._on_data_source_changed()
+        elif "proxy" in changed:
+            self._on_proxy_changed()
+        if "crypto_pairs" in changed or "display_limit" in changed:
+            self._load_pairs()
+        if "display_limit" in changed:
+            self._view_manager.adjust_window_height(settings.display_limit)
+        if "dynamic_background" in changed:
+            self._on_display_changed()
+        if "minimalist_view" in changed:
+            self._on_minimalist_view_changed()
+        if "auto_scroll" in changed or "scroll_interval" in changed:
+            self._on_auto_scroll_changed(settings.auto_scroll, settings.scroll_interval)
+        # Theme and language changes take effect after a restart
 
-    def _on_theme_changed(self):
-        pass
+    def _on_proxy_changed(self):
+        self._market_controller.set_proxy()
 
     def _on_display_changed(self):
         for card in self._cards.values():
             card.refresh_style()
 
-    def _on_display_limit_changed(self, limit: int):
-        self._load_pairs()
-        self._view_manager.adjust_window_height(limit)
-
-    def _on_minimalist_view_changed(self, enabled: bool):
-        self._settings_manager.update_minimalist_view(enabled)
+    def _on_minimalist_view_changed(self):
         self._view_manager.reset_state()
         self._view_manager.adjust_window_height()
         self._update_cards_display()
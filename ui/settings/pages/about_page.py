@@ -1,23 +1,30 @@
-import webbrowser
+import os
+from pathlib import Path
 
 from PyQt6.QtCore import QUrl
 from PyQt6.QtGui import QDesktopServices
-from PyQt6.QtWidgets import QVBoxLayout, QWidget
 from qfluentwidgets import (
     FluentIcon,
     InfoBar,
     InfoBarPosition,
     MessageBox,
     PrimaryPushSettingCard,
-    ScrollArea,
     SettingCardGroup,
 )
 
 from core.i18n import _
 from core.version import __version__
+from ui.settings.pages.base_page import SettingsPage
 
+if os.name == "nt":  # Windows
+    _LOG_DIR = Path(os.environ.get("APPDATA", "")) / "crypto-monitor" / "logs"
+else:  # Linux/Mac
+    _LOG_DIR = Path.home() / ".config" / "crypto-monitor" / "logs"
+_LOG_DIR.mkdir(parents=True, exist_ok=True)
+_LOG_DIR_URL = QUrl.fromLocalFile(str(_LOG_DIR))
 
-class AboutPage(QWidget):
+
+class AboutPage(SettingsPage):
     """About settings page."""
 
     def __init__(self, parent=None):
@@ -25,20 +32,6 @@ class AboutPage(QWidget):
         self._setup_ui()
 
     def _setup_ui(self):
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(0)
-
-        self.scroll = ScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-
-        self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet("background: transparent;")
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_layout.setContentsMargins(30, 30, 30, 30)
-        self.scroll_layout.setSpacing(20)
-
         self.about_group = SettingCardGroup(_("About"), self.scroll_content)
 
         # Version Card
@@ -60,9 +53,7 @@ class AboutPage(QWidget):
             _("View source code, report issues, or contribute"),
             self.about_group,
         )
-        self.github_card.button.clicked.connect(
-            lambda: webbrowser.open("https://github.com/shiquda/crypto-monitor")
-        )
+        self.github_card.button.clicked.connect(self._open_github)
         self.about_group.addSettingCard(self.github_card)
 
         # Log Directory Card
@@ -79,23 +70,15 @@ class AboutPage(QWidget):
         self.scroll_layout.addWidget(self.about_group)
         self.scroll_layout.addStretch(1)
 
-        self.scroll.setWidget(self.scroll_content)
-        self.layout.addWidget(self.scroll)
+    def _open_github(self):
+        """Open the project repository in the default browser."""
+        import webbrowser
+
+        webbrowser.open("https://github.com/shiquda/crypto-monitor")
 
     def _open_log_directory(self):
         """Open the application log directory in file explorer."""
-        import os
-        from pathlib import Path
-
-        if os.name == "nt":  # Windows
-            log_dir = Path(os.environ.get("APPDATA", "")) / "crypto-monitor" / "logs"
-        else:  # Linux/Mac
-            log_dir = Path.home() / ".config" / "crypto-monitor" / "logs"
-
-        if not log_dir.exists():
-            log_dir.mkdir(parents=True, exist_ok=True)
-
-        QDesktopServices.openUrl(QUrl.fromLocalFile(str(log_dir)))
+        QDesktopServices.openUrl(_LOG_DIR_URL)
 
     def _check_for_updates(self):
         """Check for updates."""
@@ -108,15 +91,13 @@ class AboutPage(QWidget):
         self._update_checker.update_available.connect(self._on_update_available)
         self._update_checker.up_to_date.connect(self._on_up_to_date)
         self._update_checker.check_failed.connect(self._on_check_failed)
-        self._update_checker.finished.connect(lambda: self.version_card.button.setEnabled(True))
-        # Wait, if I set text back here, it might conflict if up_to_date also sets it?
-        # Actually usually we revert text or leave it.
-        # Original code: self.version_card.button.setText(_("Check Update"))
-        self._update_checker.finished.connect(
-            lambda: self.version_card.button.setText(_("Check Update"))
-        )
+        self._update_checker.finished.connect(self._on_check_finished)
         self._update_checker.start()
 
+    def _on_check_finished(self):
+        self.version_card.button.setEnabled(True)
+        self.version_card.button.setText(_("Check Update"))
+
     def _on_update_available(self, release_info: dict):
         tag_name = release_info.get("tag_name", "Unknown")
         html_url = release_info.get("html_url", "")
@@ -1,15 +1,16 @@
-from PyQt6.QtWidgets import QVBoxLayout, QWidget
-from qfluentwidgets import ScrollArea, SettingCardGroup
+from qfluentwidgets import SettingCardGroup
 
 from core.i18n import _
+from ui.settings.pages.base_page import SettingsPage
 from ui.widgets.setting_cards import (
     DisplaySettingCard,
     HoverSettingCard,
     LanguageSettingCard,
+    ThemeSettingCard,
 )
 
 
-class AppearancePage(QWidget):
+class AppearancePage(SettingsPage):
     """Appearance settings page."""
 
     def __init__(self, settings_group, parent=None):
@@ -18,26 +19,9 @@ class AppearancePage(QWidget):
         self._setup_ui()
 
     def _setup_ui(self):
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(0)
-
-        # Scroll Area
-        self.scroll = ScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-
-        self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet("background: transparent;")
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_layout.setContentsMargins(30, 30, 30, 30)
-        self.scroll_layout.setSpacing(20)
-
         # Appearance Group
         self.appearance_group = SettingCardGroup(_("Appearance"), self.scroll_content)
 
-        from ui.widgets.setting_cards import ThemeSettingCard
-
         self.theme_card = ThemeSettingCard(self.appearance_group)
         self.appearance_group.addSettingCard(self.theme_card)
 
@@ -52,6 +36,3 @@ class AppearancePage(QWidget):
 
         self.scroll_layout.addWidget(self.appearance_group)
         self.scroll_layout.addStretch(1)
-
-        self.scroll.setWidget(self.scroll_content)
-        self.layout.addWidget(self.scroll)
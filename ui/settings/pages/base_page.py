@@ -0,0 +1,18 @@
+from PyQt6.QtWidgets import QVBoxLayout, QWidget
+from qfluentwidgets import ScrollArea
+
+
+class SettingsPage(ScrollArea):
+    """Scrollable settings page; subclasses add their card groups to ``scroll_layout``."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWidgetResizable(True)
+        self.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+
+        self.scroll_content = QWidget()
+        self.scroll_content.setStyleSheet("background: transparent;")
+        self.scroll_layout = QVBoxLayout(self.scroll_content)
+        self.scroll_layout.setContentsMargins(30, 30, 30, 30)
+        self.scroll_layout.setSpacing(20)
+        self.setWidget(self.scroll_content)
@@ -1,11 +1,11 @@
-from PyQt6.QtWidgets import QVBoxLayout, QWidget
-from qfluentwidgets import ScrollArea, SettingCardGroup
+from qfluentwidgets import SettingCardGroup
 
 from core.i18n import _
+from ui.settings.pages.base_page import SettingsPage
 from ui.widgets.alert_setting_card import AlertSettingCard
 
 
-class NotificationsPage(QWidget):
+class NotificationsPage(SettingsPage):
     """Notifications settings page."""
 
     def __init__(self, parent=None):
@@ -13,26 +13,9 @@ class NotificationsPage(QWidget):
         self._setup_ui()
 
     def _setup_ui(self):
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(0)
-
-        self.scroll = ScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-
-        self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet("background: transparent;")
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_layout.setContentsMargins(30, 30, 30, 30)
-        self.scroll_layout.setSpacing(20)
-
         self.alerts_group = SettingCardGroup(_("Notifications"), self.scroll_content)
         self.alerts_card = AlertSettingCard(self.alerts_group)
         self.alerts_group.addSettingCard(self.alerts_card)
 
         self.scroll_layout.addWidget(self.alerts_group)
         self.scroll_layout.addStretch(1)
-
-        self.scroll.setWidget(self.scroll_content)
-        self.layout.addWidget(self.scroll)
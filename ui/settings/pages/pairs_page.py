@@ -1,11 +1,11 @@
-from PyQt6.QtWidgets import QVBoxLayout, QWidget
-from qfluentwidgets import ScrollArea, SettingCardGroup
+from qfluentwidgets import SettingCardGroup
 
 from core.i18n import _
+from ui.settings.pages.base_page import SettingsPage
 from ui.widgets.setting_cards import PairsSettingCard
 
 
-class PairsPage(QWidget):
+class PairsPage(SettingsPage):
     """Trading Pairs settings page."""
 
     def __init__(self, parent=None):
@@ -13,20 +13,6 @@ class PairsPage(QWidget):
         self._setup_ui()
 
     def _setup_ui(self):
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(0)
-
-        self.scroll = ScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-
-        self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet("background: transparent;")
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_layout.setContentsMargins(30, 30, 30, 30)
-        self.scroll_layout.setSpacing(20)
-
         self.pairs_group = SettingCardGroup(_("Trading Pairs"), self.scroll_content)
         self.pairs_card = PairsSettingCard(self.pairs_group)
         self.pairs_group.addSettingCard(self.pairs_card)
@@ -34,9 +20,6 @@ class PairsPage(QWidget):
         self.scroll_layout.addWidget(self.pairs_group)
         self.scroll_layout.addStretch(1)
 
-        self.scroll.setWidget(self.scroll_content)
-        self.layout.addWidget(self.scroll)
-
     def set_pairs(self, pairs):
         self.pairs_card.set_pairs(pairs)
 
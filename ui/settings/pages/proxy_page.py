@@ -1,13 +1,14 @@
-from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtWidgets import QVBoxLayout, QWidget
-from qfluentwidgets import ScrollArea, SettingCardGroup
+from PyQt6.QtCore import QTimer, pyqtSignal
+from PyQt6.QtNetwork import QTcpSocket
+from qfluentwidgets import SettingCardGroup
 
 from core.i18n import _
+from ui.settings.pages.base_page import SettingsPage
 from ui.widgets.data_source_setting_card import DataSourceSettingCard
 from ui.widgets.setting_cards import ProxySettingCard
 
 
-class ProxyPage(QWidget):
+class ProxyPage(SettingsPage):
     """Network settings page."""
 
     proxy_changed = pyqtSignal()
@@ -15,24 +16,14 @@ class ProxyPage(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._test_socket: QTcpSocket | None = None
+        self._test_timer = QTimer(self)
+        self._test_timer.setSingleShot(True)
+        self._test_timer.setInterval(5000)
+        self._test_timer.timeout.connect(self._on_test_timeout)
         self._setup_ui()
 
     def _setup_ui(self):
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(0)
-
-        # Scroll Area
-        self.scroll = ScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-
-        self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet("background: transparent;")
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_layout.setContentsMargins(30, 30, 30, 30)
-        self.scroll_layout.setSpacing(20)
-
         # Network Group
         self.proxy_group = SettingCardGroup(_("Network Configuration"), self.scroll_content)
 
@@ -48,34 +39,45 @@ class ProxyPage(QWidget):
         self.scroll_layout.addWidget(self.proxy_group)
         self.scroll_layout.addStretch(1)
 
-        self.scroll.setWidget(self.scroll_content)
-        self.layout.addWidget(self.scroll)
-
     def _test_connection(self):
-        """Test proxy connection."""
-        # Get current proxy config
+        """Test proxy connection without blocking the event loop."""
+        # Toggling the proxy switch re-enables the button; let the running test finish
+        if self._test_socket is not None:
+            return
+
         proxy = self.proxy_card.get_proxy_config()
 
-        import socket
-
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            # Create a localized temporary connection logic or rely on helper
-            # To keep it simple and self-contained, using basic socket logic as in original
-            result = sock.connect_ex((proxy.host, proxy.port))
-            sock.close()
-
-            if result == 0:
-                self.proxy_card.show_test_result(True, _("Proxy server is reachable"))
-            else:
-                self.proxy_card.show_test_result(
-                    False, f"{_('Connection failed')} ({_('error code')}: {result})"
-                )
-        except OSError as e:
-            self.proxy_card.show_test_result(False, f"{_('Socket error')}: {str(e)}")
-        except Exception as e:
-            self.proxy_card.show_test_result(False, f"{_('Unexpected error')}: {str(e)}")
+        self.proxy_card.test_btn.setEnabled(False)
+        self._test_socket = QTcpSocket(self)
+        self._test_socket.connected.connect(self._on_test_connected)
+        self._test_socket.errorOccurred.connect(self._on_test_error)
+        self._test_timer.start()
+        self._test_socket.connectToHost(proxy.host, proxy.port)
+
+    def _on_test_connected(self):
+        if self.sender() is not self._test_socket:
+            return
+        self._finish_test(True, _("Proxy server is reachable"))
+
+    def _on_test_error(self, error):
+        sock = self.sender()
+        if sock is not self._test_socket:
+            return
+        self._finish_test(False, f"{_('Socket error')}: {sock.errorString()}")
+
+    def _on_test_timeout(self):
+        self._finish_test(False, f"{_('Connection failed')}: {_('Connection timed out')}")
+
+    def _finish_test(self, success: bool, message: str):
+        self._test_timer.stop()
+        sock, self._test_socket = self._test_socket, None
+        if sock is not None:
+            sock.blockSignals(True)
+            sock.abort()
+            sock.deleteLater()
+
+        self.proxy_card.test_btn.setEnabled(self.proxy_card.enable_switch.isChecked())
+        self.proxy_card.show_test_result(success, message)
 
     def set_data_source(self, source):
         self.data_source_card.set_data_source(source)
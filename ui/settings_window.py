@@ -4,19 +4,40 @@ Refactored to use modular pages.
 """
 
 import logging
-
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QIcon
+import os
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime
+
+from PyQt6.QtCore import (
+    QObject,
+    QProcess,
+    QRectF,
+    QRunnable,
+    QSize,
+    QStandardPaths,
+    Qt,
+    QThreadPool,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QBrush, QColor, QPainter, QPen, QPixmap, QPixmapCache
 from PyQt6.QtWidgets import (
+    QApplication,
+    QFileDialog,
+    QFrame,
     QHBoxLayout,
-    QLabel,
+    QListWidget,
+    QListWidgetItem,
     QMainWindow,
-    QStackedWidget,
+    QMessageBox,
+    QStackedLayout,
+    QStyle,
+    QStyledItemDelegate,
     QVBoxLayout,
     QWidget,
 )
 from qfluentwidgets import (
-    BodyLabel,
     FluentIcon,
     InfoBar,
     InfoBarPosition,
@@ -24,6 +45,8 @@ from qfluentwidgets import (
     PushButton,
     Theme,
     TitleLabel,
+    getFont,
+    qconfig,
     setTheme,
 )
 
@@ -37,32 +60,82 @@ from ui.settings.pages.proxy_page import ProxyPage
 
 logger = logging.getLogger(__name__)
 
+_THEME_COLORS = {
+    "dark": {
+        "bg": "rgb(32, 32, 32)",
+        "border": "#333333",
+    },
+    "light": {
+        "bg": "rgb(249, 249, 249)",
+        "border": "#E0E0E0",
+    },
+}
+_FLUENT_THEMES = {"dark": Theme.DARK, "light": Theme.LIGHT}
+
+# Sidebar entries are painted by NavDelegate rather than styled through QSS
+_NAV_COLORS = {
+    "dark": {
+        "text": QColor(255, 255, 255),
+        "hover": QColor(255, 255, 255, 20),
+        "selected": QColor(0, 120, 212, 64),
+    },
+    "light": {
+        "text": QColor(0, 0, 0),
+        "hover": QColor(0, 0, 0, 10),
+        "selected": QColor(0, 120, 212, 31),
+    },
+}
+_NAV_SELECTED_TEXT_COLOR = QColor("#0078D4")
+_NAV_ITEM_HEIGHT = 40
+_NAV_ITEM_GAP = 5
+
+
+_WINDOW_QSS_TEMPLATE = """
+    QMainWindow, QWidget#settingsCentral {{ background-color: {bg}; }}
+    QWidget#settingsSidebar {{ border-right: 1px solid {border}; }}
+    QWidget#settingsBottomBar {{ border-top: 1px solid {border}; }}
+    QListWidget#settingsNav {{ background: transparent; border: none; outline: none; }}
+"""
+
+# Built once at import; windows only look up the sheet for their theme
+_WINDOW_STYLESHEETS = {
+    theme: _WINDOW_QSS_TEMPLATE.format(**colors) for theme, colors in _THEME_COLORS.items()
+}
+
 
 class SettingsWindow(QMainWindow):
-    """Independent settings window with Fluent Design interface."""
-
-    proxy_changed = pyqtSignal()
-    pairs_changed = pyqtSignal()
-    theme_changed = pyqtSignal(str)
-    display_changed = pyqtSignal()
-    auto_scroll_changed = pyqtSignal(bool, int)
-    display_limit_changed = pyqtSignal(int)
-    data_source_changed = pyqtSignal()
-    data_source_changed = pyqtSignal()
-    minimalist_view_changed = pyqtSignal()
-    price_change_basis_changed = pyqtSignal()
+    """
+    Independent settings window with Fluent Design interface.
+
+    Build it once and reuse the instance; call reload() before showing it again
+    so the pages drop unsaved edits and reflect the current settings.
+    """
+
+    settings_changed = pyqtSignal(set)  # names of the AppSettings fields saved with new values
 
     def __init__(self, settings_manager: SettingsManager, parent: QWidget | None = None):
         super().__init__(parent)
         self._settings_manager = settings_manager
 
-        # Apply theme
-        theme_mode = settings_manager.settings.theme_mode
-        setTheme(Theme.DARK if theme_mode == "dark" else Theme.LIGHT)
-        self._theme_mode = theme_mode
+        # Apply theme. setTheme restyles every Fluent widget in the app, so skip it
+        # when the main window has already applied the same theme.
+        # Anything other than "dark" ("light", "auto") uses the light palette.
+        self._theme_key = "dark" if settings_manager.settings.theme_mode == "dark" else "light"
+        self._theme = _FLUENT_THEMES[self._theme_key]
+        if qconfig.themeMode.value != self._theme:
+            setTheme(self._theme)
+
+        # File dialogs are built on first use and reused afterwards
+        self._export_dialog: QFileDialog | None = None
+        self._import_dialog: QFileDialog | None = None
+        self._import_confirm_box: QMessageBox | None = None
+        # Export currently being written in the thread pool, if any
+        self._export_job: _ExportRunnable | None = None
+
+        # (kind, title, content) -> monotonic time the InfoBar was last shown
+        self._last_info: dict[tuple[str, str, str], float] = {}
 
         self._setup_ui()
-        self._load_settings()
 
     def _setup_ui(self):
         """Setup the settings window UI."""
@@ -75,14 +148,11 @@ class SettingsWindow(QMainWindow):
             flags |= Qt.WindowType.WindowStaysOnTopHint
         self.setWindowFlags(flags)
 
-        self.setWindowIcon(QIcon("assets/icons/crypto-monitor.png"))
-
-        # Background
-        bg_color = "rgb(32, 32, 32)" if self._theme_mode == "dark" else "rgb(249, 249, 249)"
-        self.setStyleSheet(f"QMainWindow {{ background-color: {bg_color}; }}")
+        # One stylesheet for the whole window; widgets are targeted by object name
+        self.setStyleSheet(_WINDOW_STYLESHEETS[self._theme_key])
 
         central = QWidget()
-        central.setStyleSheet(f"QWidget {{ background-color: {bg_color}; }}")
+        central.setObjectName("settingsCentral")
         self.setCentralWidget(central)
 
         main_h_layout = QHBoxLayout(central)
@@ -90,7 +160,7 @@ class SettingsWindow(QMainWindow):
         main_h_layout.setSpacing(0)
 
         # --- Sidebar ---
-        self._setup_sidebar(main_h_layout, bg_color)
+        self._setup_sidebar(main_h_layout)
 
         # --- Content ---
         content_container = QWidget()
@@ -98,90 +168,80 @@ class SettingsWindow(QMainWindow):
         content_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.setSpacing(0)
 
-        self.stack_widget = QStackedWidget()
-        self.stack_widget.setStyleSheet("background: transparent;")
-
-        # Instantiate Pages
-        # Note: AppearancePage signature in my impl had unused arg, passing None
-        self.appearance_page = AppearancePage(None, self)
-        self.proxy_page = ProxyPage(self)
-        self.pairs_page = PairsPage(self)
-        self.notifications_page = NotificationsPage(self)
-        self.about_page = AboutPage(self)
-
-        # Connect signals from pages if any (e.g. proxy page has internal test logic)
-        # However, typically settings are saved on "Save", not interactively,
-        # EXCEPT for "Test connection" which is internal to ProxyPage's card.
-        # But wait, original code connected `proxy_card.test_requested` to `_test_connection` in `SettingsWindow`.
-        # In my ProxyPage, I moved `_test_connection` INTO ProxyPage. So it handles itself. Good.
-
-        # Add pages to stack
-        self.stack_widget.addWidget(self.appearance_page)  # 0: Appearance
-        self.stack_widget.addWidget(self.proxy_page)  # 1: Network
-        self.stack_widget.addWidget(self.pairs_page)  # 2: Pairs
-        self.stack_widget.addWidget(self.notifications_page)  # 3: Notifications
-        self.stack_widget.addWidget(self.about_page)  # 4: About
-
-        content_layout.addWidget(self.stack_widget)
+        # Pages stack directly in the content layout, without a QStackedWidget in between
+        self.stack_layout = QStackedLayout()
+
+        # Pages are built on first navigation; the stack holds placeholders until then
+        self.appearance_page: AppearancePage | None = None
+        self.proxy_page: ProxyPage | None = None
+        self.pairs_page: PairsPage | None = None
+        self.notifications_page: NotificationsPage | None = None
+        self.about_page: AboutPage | None = None
+        self._page_factories = {
+            0: ("appearance_page", lambda: AppearancePage(None, self)),
+            1: ("proxy_page", lambda: ProxyPage(self)),
+            2: ("pairs_page", lambda: PairsPage(self)),
+            3: ("notifications_page", lambda: NotificationsPage(self)),
+            4: ("about_page", lambda: AboutPage(self)),
+        }
+        for _index in range(len(self._page_factories)):
+            self.stack_layout.addWidget(QWidget())
+
+        content_layout.addLayout(self.stack_layout)
 
         # --- Bottom Bar ---
-        self._setup_bottom_bar(content_layout, bg_color)
+        self._setup_bottom_bar(content_layout)
 
         main_h_layout.addWidget(content_container)
 
         # Navigation mapping
         self._setup_nav_buttons()
+        self._switch_view(0)
 
-        if self.nav_btns:
-            self._switch_view(0)
-
-    def _setup_sidebar(self, parent_layout, bg_color):
+    def _setup_sidebar(self, parent_layout):
         sidebar = QWidget()
+        sidebar.setObjectName("settingsSidebar")
         sidebar.setFixedWidth(200)
-        border_color = "#333333" if self._theme_mode == "dark" else "#E0E0E0"
-        sidebar.setStyleSheet(
-            f"QWidget {{ background-color: {bg_color}; border-right: 1px solid {border_color}; }}"
-        )
 
         self.sidebar_layout = QVBoxLayout(sidebar)
         self.sidebar_layout.setContentsMargins(10, 20, 10, 20)
         self.sidebar_layout.setSpacing(5)
 
         title = TitleLabel(_("Settings"))
-        title_color = "white" if self._theme_mode == "dark" else "black"
-        title.setStyleSheet(f"padding-left: 10px; margin-bottom: 10px; color: {title_color};")
+        title.setContentsMargins(10, 0, 0, 10)
         self.sidebar_layout.addWidget(title)
 
         parent_layout.addWidget(sidebar)
 
     def _setup_nav_buttons(self):
-        # We need to recreate NavItem as it was internal class, or define it here.
-        # For simplicity, defining inline again or extracting.
-        # To save lines in this file, I'll define it inline here but simplified.
-
-        self.nav_btns = []
-        is_dark = self._theme_mode == "dark"
-
-        def add_nav(text, icon, index):
-            btn = NavItem(text, icon, self, is_dark)
-            btn.clicked.connect(lambda: self._switch_view(index))
-            self.sidebar_layout.addWidget(btn)
-            self.nav_btns.append(btn)
-
-        add_nav(_("Appearance"), FluentIcon.BRUSH, 0)
-        add_nav(_("Network"), FluentIcon.GLOBE, 1)
-        add_nav(_("Trading Pairs"), FluentIcon.MARKET, 2)
-        add_nav(_("Notifications"), FluentIcon.RINGER, 3)
-        add_nav(_("About"), FluentIcon.PEOPLE, 4)
-
-        self.sidebar_layout.addStretch(1)
-
-    def _setup_bottom_bar(self, parent_layout, bg_color):
+        self.nav_list = QListWidget()
+        self.nav_list.setObjectName("settingsNav")
+        self.nav_list.setItemDelegate(NavDelegate(self._theme_key, self.nav_list))
+        self.nav_list.setFrameShape(QFrame.Shape.NoFrame)
+        self.nav_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.nav_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.nav_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.nav_list.setMouseTracking(True)
+        self.nav_list.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+
+        # Row order matches the page order in the stack
+        self._add_nav_item(_("Appearance"), FluentIcon.BRUSH)
+        self._add_nav_item(_("Network"), FluentIcon.GLOBE)
+        self._add_nav_item(_("Trading Pairs"), FluentIcon.MARKET)
+        self._add_nav_item(_("Notifications"), FluentIcon.RINGER)
+        self._add_nav_item(_("About"), FluentIcon.PEOPLE)
+
+        self.nav_list.currentRowChanged.connect(self._switch_view)
+        self.sidebar_layout.addWidget(self.nav_list, 1)
+
+    def _add_nav_item(self, text, icon):
+        item = QListWidgetItem(text)
+        item.setData(Qt.ItemDataRole.DecorationRole, _fluent_pixmap(icon, self._theme))
+        self.nav_list.addItem(item)
+
+    def _setup_bottom_bar(self, parent_layout):
         btn_bar = QWidget()
-        border_color = "#333333" if self._theme_mode == "dark" else "#E0E0E0"
-        btn_bar.setStyleSheet(
-            f"QWidget {{ background-color: {bg_color}; border-top: 1px solid {border_color}; }}"
-        )
+        btn_bar.setObjectName("settingsBottomBar")
 
         btn_layout = QHBoxLayout(btn_bar)
         btn_layout.setContentsMargins(30, 15, 30, 20)
@@ -209,100 +269,104 @@ class SettingsWindow(QMainWindow):
         parent_layout.addWidget(btn_bar)
 
     def _switch_view(self, index):
-        self.stack_widget.setCurrentIndex(index)
-        for i, btn in enumerate(self.nav_btns):
-            btn.set_selected(i == index)
-
-    def _load_settings(self):
-        """Load settings into pages."""
+        self._ensure_page(index)
+        self.stack_layout.setCurrentIndex(index)
+        self.nav_list.setCurrentRow(index)
+
+    def _ensure_page(self, index: int):
+        """Build the page at ``index`` the first time it is shown."""
+        entry = self._page_factories.pop(index, None)
+        if entry is None:
+            return
+        attr, factory = entry
+        page = factory()
+        setattr(self, attr, page)
+
+        placeholder = self.stack_layout.widget(index)
+        self.stack_layout.insertWidget(index, page)
+        self.stack_layout.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._load_settings(page)
+
+    def reload(self):
+        """Re-sync every built page that shows stored settings (all but About)."""
+        for page in (self.appearance_page, self.proxy_page, self.pairs_page):
+            if page is not None:
+                self._load_settings(page)
+        # Alerts can be added from the main window while this one is hidden
+        if self.notifications_page is not None:
+            self.notifications_page.alerts_card.refresh()
+
+    def _load_settings(self, page: QWidget):
+        """Load settings into a freshly built page."""
         s = self._settings_manager.settings
 
-        # Appearance Page
-        self.appearance_page.theme_card.set_theme_mode(s.theme_mode)
-        self.appearance_page.language_card.set_language(s.language)
-        self.appearance_page.display_card.set_color_schema(s.color_schema)
-        self.appearance_page.display_card.set_dynamic_background(s.dynamic_background)
-        self.appearance_page.display_card.set_display_limit(s.display_limit)
-        self.appearance_page.display_card.set_minimalist_view(s.minimalist_view)
-        self.appearance_page.display_card.set_auto_scroll(s.auto_scroll, s.scroll_interval)
-        self.appearance_page.hover_card.set_values(
-            s.hover_enabled,
-            s.hover_show_stats,
-            s.hover_show_chart,
-            s.kline_period,
-            s.chart_cache_ttl,
-        )
-        self.appearance_page.display_card.set_price_change_basis(s.price_change_basis)
-
-        # Proxy Page
-        self.proxy_page.set_data_source(s.data_source)
-        self.proxy_page.set_proxy_config(s.proxy)
-
-        # Pairs Page
-        self.pairs_page.set_pairs(s.crypto_pairs)
-
-        # Notifications Page
-        # NOTE: In old code, AlertSettingCard managed its own loading/saving logic?
-        # Checking old code: `self.alerts_card = AlertSettingCard(self.alerts_group)`
-        # It seems AlertSettingCard might handle its own state or load from global?
-        # Wait, AlertSettingCard in ui/widgets/alert_setting_card.py:
-        # It has `_load_alerts` in `__init__`. So it loads automatically from settings_manager (singleton?).
-        # If so, we don't need to manually load it here.
-        pass
+        # Repaint the page once after all cards are set instead of after each setter
+        page.setUpdatesEnabled(False)
+        try:
+            if page is self.appearance_page:
+                page.theme_card.set_theme_mode(s.theme_mode)
+                page.language_card.set_language(s.language)
+                page.display_card.set_color_schema(s.color_schema)
+                page.display_card.set_dynamic_background(s.dynamic_background)
+                page.display_card.set_display_limit(s.display_limit)
+                page.display_card.set_minimalist_view(s.minimalist_view)
+                page.display_card.set_auto_scroll(s.auto_scroll, s.scroll_interval)
+                page.hover_card.set_values(
+                    s.hover_enabled,
+                    s.hover_show_stats,
+                    s.hover_show_chart,
+                    s.kline_period,
+                    s.chart_cache_ttl,
+                )
+                page.display_card.set_price_change_basis(s.price_change_basis)
+            elif page is self.proxy_page:
+                page.set_data_source(s.data_source)
+                page.set_proxy_config(s.proxy)
+            elif page is self.pairs_page:
+                page.set_pairs(s.crypto_pairs)
+            # The Notifications page loads itself when built and is refreshed by reload()
+        finally:
+            page.setUpdatesEnabled(True)
 
     def _save_settings(self):
         """Gather values from pages and save."""
-        s = self._settings_manager.settings
+        # Pages that were never opened still hold the saved values, so skip them
+        new_values = {}
 
         # --- Appearance ---
-        new_theme = self.appearance_page.theme_card.get_theme_mode()
-        new_lang = self.appearance_page.language_card.get_language()
-        new_schema = self.appearance_page.display_card.get_color_schema()
-        new_dynamic_bg = self.appearance_page.display_card.get_dynamic_background()
-        new_limit = self.appearance_page.display_card.get_display_limit()
-        new_mini_view = self.appearance_page.display_card.get_minimalist_view()
-        new_auto_scroll, new_scroll_int = self.appearance_page.display_card.get_auto_scroll()
-        new_basis = self.appearance_page.display_card.get_price_change_basis()
-        hover_vals = self.appearance_page.hover_card.get_values()
+        if self.appearance_page is not None:
+            display_card = self.appearance_page.display_card
+            hover_vals = self.appearance_page.hover_card.get_values()
+            new_auto_scroll, new_scroll_int = display_card.get_auto_scroll()
+            new_values.update(
+                theme_mode=self.appearance_page.theme_card.get_theme_mode(),
+                language=self.appearance_page.language_card.get_language(),
+                color_schema=display_card.get_color_schema(),
+                dynamic_background=display_card.get_dynamic_background(),
+                display_limit=display_card.get_display_limit(),
+                minimalist_view=display_card.get_minimalist_view(),
+                auto_scroll=new_auto_scroll,
+                scroll_interval=new_scroll_int,
+                price_change_basis=display_card.get_price_change_basis(),
+                hover_enabled=hover_vals["enabled"],
+                hover_show_stats=hover_vals["show_stats"],
+                hover_show_chart=hover_vals["show_chart"],
+                kline_period=hover_vals["period"],
+                chart_cache_ttl=hover_vals["cache_ttl"],
+            )
 
         # --- Network ---
-        new_source = self.proxy_page.get_data_source()
-        new_proxy = self.proxy_page.get_proxy_config()
+        if self.proxy_page is not None:
+            new_values["data_source"] = self.proxy_page.get_data_source()
+            new_values["proxy"] = self.proxy_page.get_proxy_config()
 
         # --- Pairs ---
-        new_pairs = self.pairs_page.get_pairs()
-
-        # Change detection
-        theme_changed = s.theme_mode != new_theme
-        lang_changed = s.language != new_lang
-        source_changed = s.data_source != new_source
-        dynamic_bg_changed = s.dynamic_background != new_dynamic_bg
-        limit_changed = s.display_limit != new_limit
-        mini_view_changed = s.minimalist_view != new_mini_view
-        auto_scroll_changed = (s.auto_scroll != new_auto_scroll) or (
-            s.scroll_interval != new_scroll_int
-        )
-        basis_changed = s.price_change_basis != new_basis
-
-        # Updates
-        self._settings_manager.update_theme(new_theme)
-        self._settings_manager.update_language(new_lang)
-        self._settings_manager.update_color_schema(new_schema)
-        self._settings_manager.update_dynamic_background(new_dynamic_bg)
-        self._settings_manager.update_display_limit(new_limit)
-        self._settings_manager.update_minimalist_view(new_mini_view)
-        self._settings_manager.update_auto_scroll(new_auto_scroll, new_scroll_int)
-        self._settings_manager.update_price_change_basis(new_basis)
-
-        self._settings_manager.update_hover_settings(
-            hover_vals["enabled"], hover_vals["show_stats"], hover_vals["show_chart"]
-        )
-        self._settings_manager.update_kline_period(hover_vals["period"])
-        s.chart_cache_ttl = hover_vals["cache_ttl"]
+        if self.pairs_page is not None:
+            new_values["crypto_pairs"] = self.pairs_page.get_pairs()
 
-        self._settings_manager.update_data_source(new_source)
-        self._settings_manager.update_proxy(new_proxy)
-        self._settings_manager.update_pairs(new_pairs)
+        # Only fields that differ are written, with a single save
+        changed = self._settings_manager.update_many(new_values)
 
         # Notifications
         # AlertSettingCard handles its own saving via internal logic if I recall correctly?
@@ -312,103 +376,88 @@ class SettingsWindow(QMainWindow):
         # Assuming it's self-contained for add/remove/toggle.
 
         # Feedback and Signals
-        if theme_changed or lang_changed:
-            bar = InfoBar.success(
-                title=_("Settings Saved"),
-                content=_("Please restart the application for changes to take effect"),
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
+        if "theme_mode" in changed or "language" in changed:
+            bar = self._info(
+                "success",
+                _("Settings Saved"),
+                _("Please restart the application for changes to take effect"),
                 duration=5000,
-                parent=self,
+                position=InfoBarPosition.TOP,
             )
-            restart_btn = PushButton(_("Restart Now"))
-            restart_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            restart_btn.clicked.connect(self._restart_app)
-            bar.addWidget(restart_btn)
-            bar.show()
+            if bar is not None:
+                restart_btn = PushButton(_("Restart Now"))
+                restart_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+                restart_btn.clicked.connect(self._restart_app)
+                bar.addWidget(restart_btn)
+                bar.show()
         else:
-            InfoBar.success(
+            self._info(
+                "success",
                 _("Settings Saved"),
                 _("Your settings have been saved successfully"),
-                parent=self,
                 duration=2000,
             )
 
-        from PyQt6.QtCore import QTimer
-
-        QTimer.singleShot(100, lambda: self.proxy_changed.emit())
-        QTimer.singleShot(100, lambda: self.pairs_changed.emit())
-        if theme_changed:
-            QTimer.singleShot(100, lambda: self.theme_changed.emit(new_theme))
-        if source_changed:
-            QTimer.singleShot(100, lambda: self.data_source_changed.emit())
-        if dynamic_bg_changed:
-            QTimer.singleShot(100, lambda: self.display_changed.emit())
-        if mini_view_changed:
-            QTimer.singleShot(100, lambda: self.minimalist_view_changed.emit())
-        if auto_scroll_changed:
-            QTimer.singleShot(
-                100,
-                lambda: self.auto_scroll_changed.emit(new_auto_scroll, new_scroll_int),
-            )
-        if basis_changed:
-            QTimer.singleShot(100, lambda: self.price_change_basis_changed.emit())
-        if limit_changed:
-            self.display_limit_changed.emit(new_limit)
+        # One batched notification; listeners connect it with a queued connection,
+        # so it is handled once control returns to the event loop.
+        if changed:
+            self.settings_changed.emit(changed)
 
     def _reset_settings(self):
         default_proxy = ProxyConfig()
-        self.proxy_page.set_proxy_config(default_proxy)
+        if self.proxy_page is not None:
+            self.proxy_page.set_proxy_config(default_proxy)
         self._settings_manager.update_proxy(default_proxy)
 
-        InfoBar.info(_("Settings Reset"), _("Settings have been reset to defaults"), parent=self)
-        self.proxy_changed.emit()
+        self._info("info", _("Settings Reset"), _("Settings have been reset to defaults"))
+        self.settings_changed.emit({"proxy"})
 
     def _export_settings(self):
-        from datetime import datetime
+        # Ignore clicks while the previous export is still being written
+        if self._export_job is not None:
+            return
 
-        from PyQt6.QtWidgets import QFileDialog
+        if self._export_dialog is None:
+            self._export_dialog = QFileDialog(self, _("Export Configuration"))
+            self._export_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            self._export_dialog.setNameFilter("JSON Files (*.json)")
+            self._export_dialog.setOption(QFileDialog.Option.DontResolveSymlinks)
+            self._export_dialog.setDirectory(_documents_dir())
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filepath, _filter = QFileDialog.getSaveFileName(
-            self,
-            _("Export Configuration"),
-            f"crypto-monitor_config_{timestamp}.json",
-            "JSON Files (*.json)",
-        )
-        if filepath:
-            try:
-                self._settings_manager.export_to_file(filepath)
-                InfoBar.success(_("Success"), _("Configuration exported successfully"), parent=self)
-            except Exception as e:
-                InfoBar.error(
-                    _("Error"),
-                    f"{_('Failed to export configuration')}: {e}",
-                    parent=self,
-                )
+        self._export_dialog.selectFile(f"crypto-monitor_config_{timestamp}.json")
+        if self._export_dialog.exec():
+            filepath = self._export_dialog.selectedFiles()[0]
+            # Snapshot on the GUI thread; only serialization and disk I/O run in the pool
+            data = asdict(self._settings_manager.settings)
+            self._export_job = _ExportRunnable(self._settings_manager, filepath, data)
+            self._export_job.signals.finished.connect(self._on_export_finished)
+            self.export_btn.setEnabled(False)
+            QThreadPool.globalInstance().start(self._export_job)
+
+    def _on_export_finished(self, error: str):
+        self._export_job = None
+        self.export_btn.setEnabled(True)
+        if error:
+            self._info("error", _("Error"), f"{_('Failed to export configuration')}: {error}")
+        else:
+            self._info("success", _("Success"), _("Configuration exported successfully"))
 
     def _import_settings(self):
-        import sys
-
-        from PyQt6.QtCore import QProcess
-        from PyQt6.QtWidgets import QApplication, QFileDialog, QMessageBox
+        if self._import_dialog is None:
+            self._import_dialog = QFileDialog(self, _("Import Configuration"))
+            self._import_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._import_dialog.setNameFilter("JSON Files (*.json)")
+            self._import_dialog.setOptions(
+                QFileDialog.Option.DontResolveSymlinks | QFileDialog.Option.ReadOnly
+            )
+            self._import_dialog.setDirectory(_documents_dir())
 
-        filepath, _filter = QFileDialog.getOpenFileName(
-            self, _("Import Configuration"), "", "JSON Files (*.json)"
-        )
-        if filepath:
-            if (
-                QMessageBox.question(
-                    self,
-                    _("Confirm Import"),
-                    _(
-                        "Importing configuration will overwrite your current settings. This requires a restart. Continue?"
-                    ),
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                )
-                == QMessageBox.StandardButton.Yes
-            ):
+        if self._import_dialog.exec():
+            filepath = self._import_dialog.selectedFiles()[0]
+            if self._import_confirm_box is None:
+                self._import_confirm_box = self._make_import_confirm_box()
+            if self._import_confirm_box.exec() == QMessageBox.StandardButton.Yes:
                 try:
                     self._settings_manager.import_from_file(filepath)
                     QMessageBox.information(
@@ -417,79 +466,143 @@ class SettingsWindow(QMainWindow):
                         _("Configuration imported successfully. The application will now restart."),
                     )
 
-                    # Restart application
-                    QApplication.quit()
-                    QProcess.startDetached(sys.executable, sys.argv)
+                    self._restart_app()
                 except Exception as e:
-                    InfoBar.error(
-                        _("Error"),
-                        f"{_('Failed to import configuration')}: {e}",
-                        parent=self,
-                    )
+                    self._info("error", _("Error"), f"{_('Failed to import configuration')}: {e}")
+
+    def _make_import_confirm_box(self) -> QMessageBox:
+        return QMessageBox(
+            QMessageBox.Icon.Question,
+            _("Confirm Import"),
+            _(
+                "Importing configuration will overwrite your current settings. This requires a restart. Continue?"
+            ),
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self,
+        )
+
+    def _info(
+        self,
+        kind: str,
+        title: str,
+        content: str,
+        duration: int = 1000,
+        position: InfoBarPosition = InfoBarPosition.TOP_RIGHT,
+    ) -> InfoBar | None:
+        """Show an InfoBar, skipping an identical one shown within the last 300 ms."""
+        now = time.monotonic()
+        key = (kind, title, content)
+        if now - self._last_info.get(key, 0.0) < 0.3:
+            return None
+        self._last_info[key] = now
+        return getattr(InfoBar, kind)(
+            title=title,
+            content=content,
+            orient=Qt.Orientation.Horizontal,
+            isClosable=True,
+            duration=duration,
+            position=position,
+            parent=self,
+        )
 
     def _restart_app(self):
         """Restart the application."""
-        import sys
+        if sys.platform == "win32":
+            QApplication.quit()
+            QProcess.startDetached(sys.executable, sys.argv)
+            return
+        # Replace this process once the event loop has stopped instead of running
+        # a second interpreter next to the one that is shutting down
+        QApplication.instance().aboutToQuit.connect(_exec_self)
+        QApplication.quit()
 
-        from PyQt6.QtCore import QProcess
-        from PyQt6.QtWidgets import QApplication
 
-        QApplication.quit()
-        QProcess.startDetached(sys.executable, sys.argv)
+def _exec_self():
+    """Re-execute the current interpreter with the original arguments (POSIX)."""
+    logging.shutdown()
+    os.execv(sys.executable, [sys.executable, *sys.argv])
 
 
-# Inline NavItem for self-containment if not extracting
-class NavItem(QWidget):
-    clicked = pyqtSignal()
+class _ExportSignals(QObject):
+    finished = pyqtSignal(str)  # error message, empty on success
 
-    def __init__(self, text, icon, parent=None, is_dark=False):
-        super().__init__(parent)
-        self.is_dark = is_dark
-        self.is_selected = False
-        self.setFixedHeight(40)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(13, 0, 10, 0)
-        layout.setSpacing(12)
-
-        self.icon_label = QLabel()
-        self.icon_label.setFixedSize(16, 16)
-        self.icon_label.setScaledContents(True)
-        from qfluentwidgets import Theme
-
-        self.icon_label.setPixmap(icon.icon(Theme.DARK if is_dark else Theme.LIGHT).pixmap(16, 16))
-        layout.addWidget(self.icon_label)
-
-        self.text_label = BodyLabel(text)
-        self.text_label.setStyleSheet(
-            f"color: {'white' if is_dark else 'black'}; background: transparent; border: none;"
-        )
-        layout.addWidget(self.text_label)
-        layout.addStretch()
-
-    def set_selected(self, selected: bool):
-        self.is_selected = selected
-        if self.is_selected:
-            bg = "rgba(0, 120, 212, 0.25)" if self.is_dark else "rgba(0, 120, 212, 0.12)"
-            self.setStyleSheet(f"background-color: {bg}; border-radius: 5px;")
-            self.text_label.setStyleSheet("color: #0078D4; background: transparent; border: none;")
+
+class _ExportRunnable(QRunnable):
+    """Writes a settings snapshot to disk on the global thread pool."""
+
+    def __init__(self, settings_manager: SettingsManager, filepath: str, data: dict):
+        super().__init__()
+        self.signals = _ExportSignals()
+        self._settings_manager = settings_manager
+        self._filepath = filepath
+        self._data = data
+
+    def run(self):
+        try:
+            self._settings_manager.export_to_file(self._filepath, self._data)
+        except Exception as e:
+            self.signals.finished.emit(str(e))
         else:
-            self.setStyleSheet("background-color: transparent;")
-            self.text_label.setStyleSheet(
-                f"color: {'white' if self.is_dark else 'black'}; background: transparent; border: none;"
-            )
+            self.signals.finished.emit("")
+
+
+def _documents_dir() -> str:
+    """Start file dialogs in Documents rather than the (possibly networked) working directory."""
+    return QStandardPaths.writableLocation(QStandardPaths.StandardLocation.DocumentsLocation)
+
 
-    def enterEvent(self, event):
-        if not self.is_selected:
-            bg = "rgba(255, 255, 255, 0.08)" if self.is_dark else "rgba(0, 0, 0, 0.04)"
-            self.setStyleSheet(f"background-color: {bg}; border-radius: 5px;")
-        super().enterEvent(event)
+def _fluent_pixmap(icon: FluentIcon, theme: Theme, size: int = 16) -> QPixmap:
+    """Render a Fluent icon through the global QPixmapCache instead of rasterizing it again."""
+    key = f"fl:{icon.value}:{theme.value}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = icon.icon(theme).pixmap(size, size)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
 
-    def leaveEvent(self, event):
-        self.set_selected(self.is_selected)  # restore style
-        super().leaveEvent(event)
 
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit()
-        super().mousePressEvent(event)
+class NavDelegate(QStyledItemDelegate):
+    """Paints sidebar entries directly: rounded hover/selected background, icon and label."""
+
+    def __init__(self, theme_key: str, parent=None):
+        super().__init__(parent)
+        # Brushes and pens are built once so paint() does no QColor conversions
+        colors = _NAV_COLORS[theme_key]
+        self._hover_brush = QBrush(colors["hover"])
+        self._selected_brush = QBrush(colors["selected"])
+        self._text_pen = QPen(colors["text"])
+        self._selected_text_pen = QPen(_NAV_SELECTED_TEXT_COLOR)
+        self._font = getFont(14)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), _NAV_ITEM_HEIGHT + _NAV_ITEM_GAP)
+
+    def paint(self, painter, option, index):
+        rect = option.rect.adjusted(0, 0, 0, -_NAV_ITEM_GAP)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if selected:
+            background = self._selected_brush
+        elif option.state & QStyle.StateFlag.State_MouseOver:
+            background = self._hover_brush
+        else:
+            background = None
+        if background is not None:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(background)
+            painter.drawRoundedRect(QRectF(rect), 5, 5)
+
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        painter.drawPixmap(rect.left() + 13, rect.top() + (rect.height() - 16) // 2, pixmap)
+
+        painter.setFont(self._font)
+        painter.setPen(self._selected_text_pen if selected else self._text_pen)
+        painter.drawText(
+            rect.adjusted(13 + 16 + 12, 0, -10, 0),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            index.data(Qt.ItemDataRole.DisplayRole),
+        )
+        painter.restore()
@@ -2,174 +2,56 @@
 Theme and stylesheet management.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 # Dark theme colors
-DARK_COLORS = {
-    "background": "#1B2636",
-    "card_background": "#13191D",
-    "text": "#FFFFFF",
-    "text_secondary": "#AAAAAA",
-    "border": "#3A4A5A",
-    "hover": "rgba(255, 255, 255, 0.1)",
-    "positive": "#99FF99",
-    "negative": "#FF9999",
-    "accent": "#4A9A4A",
-}
+DARK_COLORS = MappingProxyType(
+    {
+        "background": "#1B2636",
+        "card_background": "#13191D",
+        "text": "#FFFFFF",
+        "text_secondary": "#AAAAAA",
+        "border": "#3A4A5A",
+        "hover": "rgba(255, 255, 255, 0.1)",
+        "positive": "#99FF99",
+        "negative": "#FF9999",
+        "accent": "#4A9A4A",
+    }
+)
 
 # Light theme colors
-LIGHT_COLORS = {
-    "background": "#F5F5F5",
-    "card_background": "#FFFFFF",
-    "text": "#000000",
-    "text_secondary": "#666666",
-    "border": "#E0E0E0",
-    "hover": "rgba(0, 0, 0, 0.05)",
-    "positive": "#2E7D32",
-    "negative": "#C62828",
-    "accent": "#1976D2",
-}
+LIGHT_COLORS = MappingProxyType(
+    {
+        "background": "#F5F5F5",
+        "card_background": "#FFFFFF",
+        "text": "#000000",
+        "text_secondary": "#666666",
+        "border": "#E0E0E0",
+        "hover": "rgba(0, 0, 0, 0.05)",
+        "positive": "#2E7D32",
+        "negative": "#C62828",
+        "accent": "#1976D2",
+    }
+)
 
-# Default to light colors for backward compatibility
-COLORS = LIGHT_COLORS
+# Color table per theme mode; unknown modes fall back to the light colors
+_COLOR_TABLE = {"light": LIGHT_COLORS, "dark": DARK_COLORS}
 
-# Stylesheet templates
-STYLESHEETS = {
-    "main_window": f"""
-        QMainWindow, QWidget#centralWidget {{
-            background-color: {COLORS["background"]};
-        }}
-    """,
-    "crypto_card": f"""
-        QWidget#cryptoCard {{
-            background-color: {COLORS["card_background"]};
-            border-radius: 8px;
-        }}
-        QWidget#cryptoCard:hover {{
-            background-color: #1A2228;
-        }}
-        QLabel#symbolLabel {{
-            color: {COLORS["text"]};
-            font-size: 16px;
-            font-weight: bold;
-        }}
-        QLabel#priceLabel {{
-            color: {COLORS["text"]};
-            font-size: 16px;
-            font-weight: bold;
-        }}
-        QLabel#percentageLabel {{
-            font-size: 14px;
-        }}
-        QLabel#removeButton {{
-            color: #FF6666;
-            font-size: 14px;
-            padding: 2px 6px;
-        }}
-        QLabel#removeButton:hover {{
-            background-color: rgba(255, 100, 100, 0.2);
-            border-radius: 4px;
-        }}
-    """,
-    "settings_window": f"""
-        QMainWindow {{
-            background-color: {COLORS["background"]};
-        }}
-        QWidget {{
-            color: {COLORS["text"]};
-        }}
-        QGroupBox {{
-            border: 1px solid {COLORS["border"]};
-            border-radius: 8px;
-            margin-top: 10px;
-            padding-top: 10px;
-            font-weight: bold;
-        }}
-        QGroupBox::title {{
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-        }}
-        QLineEdit, QSpinBox, QComboBox {{
-            background-color: #2A3A4A;
-            border: 1px solid {COLORS["border"]};
-            border-radius: 4px;
-            padding: 8px;
-            color: {COLORS["text"]};
-        }}
-        QLineEdit:focus, QSpinBox:focus, QComboBox:focus {{
-            border-color: {COLORS["accent"]};
-        }}
-        QCheckBox {{
-            spacing: 8px;
-        }}
-        QCheckBox::indicator {{
-            width: 18px;
-            height: 18px;
-            border-radius: 4px;
-            border: 1px solid {COLORS["border"]};
-        }}
-        QCheckBox::indicator:checked {{
-            background-color: {COLORS["accent"]};
-            border-color: {COLORS["accent"]};
-        }}
-        QPushButton {{
-            background-color: #3A4A5A;
-            border: none;
-            border-radius: 4px;
-            padding: 10px 20px;
-            color: {COLORS["text"]};
-            font-weight: bold;
-        }}
-        QPushButton:hover {{
-            background-color: #4A5A6A;
-        }}
-        QPushButton:pressed {{
-            background-color: #2A3A4A;
-        }}
-        QPushButton#testButton {{
-            background-color: {COLORS["accent"]};
-        }}
-        QPushButton#testButton:hover {{
-            background-color: #5AAA5A;
-        }}
-        QPushButton#resetButton {{
-            background-color: #5A4A4A;
-        }}
-        QPushButton#resetButton:hover {{
-            background-color: #6A5A5A;
-        }}
-        QLabel#statusLabel {{
-            padding: 10px;
-            border-radius: 4px;
-        }}
-        QLabel#statusInfo {{
-            background-color: #E3F2FD;
-            color: #1976D2;
-        }}
-        QLabel#statusSuccess {{
-            background-color: #E8F5E9;
-            color: #2E7D32;
-        }}
-        QLabel#statusError {{
-            background-color: #FFEBEE;
-            color: #C62828;
-        }}
-    """,
-}
+# Returned by get_color for unknown names ("#FFFFFF" only in light mode)
+_FALLBACK_COLORS = {"light": "#FFFFFF"}
 
 
-def get_theme_colors(theme_mode: str) -> dict:
+def get_theme_colors(theme_mode: str) -> Mapping[str, str]:
     """Get color scheme based on theme mode."""
-    if theme_mode == "dark":
-        return DARK_COLORS
-    else:  # "light" or default
-        return LIGHT_COLORS
+    # "light" or any unknown mode falls back to the light colors
+    return _COLOR_TABLE.get(theme_mode, LIGHT_COLORS)
 
 
-def get_stylesheet(name: str, theme_mode: str = "light") -> str:
-    """Get a stylesheet by name with theme support."""
+def _build_stylesheets(theme_mode: str) -> dict[str, str]:
+    """Format every themed stylesheet for one theme mode."""
     colors = get_theme_colors(theme_mode)
 
-    # Generate stylesheets dynamically based on theme
     stylesheets = {
         "main_window": f"""
             QMainWindow, QWidget#centralWidget {{
@@ -294,10 +176,22 @@ def get_stylesheet(name: str, theme_mode: str = "light") -> str:
         """,
     }
 
-    return stylesheets.get(name, "")
+    return stylesheets
+
+
+# Both themes are formatted once at import; lookups never re-run the f-strings
+_BUILT_STYLESHEETS = {
+    theme_mode: _build_stylesheets(theme_mode) for theme_mode in ("light", "dark")
+}
+
+
+def get_stylesheet(name: str, theme_mode: str = "light") -> str:
+    """Get a stylesheet by name with theme support."""
+    # Anything other than "dark" ("light", "auto") uses the light stylesheets
+    return _BUILT_STYLESHEETS.get(theme_mode, _BUILT_STYLESHEETS["light"]).get(name, "")
 
 
 def get_color(name: str, theme_mode: str = "light") -> str:
     """Get a color by name with theme support."""
-    colors = get_theme_colors(theme_mode)
-    return colors.get(name, "#FFFFFF" if theme_mode == "light" else "#000000")
+    colors = _COLOR_TABLE.get(theme_mode, LIGHT_COLORS)
+    return colors.get(name, _FALLBACK_COLORS.get(theme_mode, "#000000"))
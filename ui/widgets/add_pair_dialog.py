@@ -1,6 +1,8 @@
-import json
+import heapq
 import logging
 import re
+import time
+from collections import OrderedDict
 
 from PyQt6.QtCore import Qt, QTimer, QUrl
 from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkProxy, QNetworkReply, QNetworkRequest
@@ -15,12 +17,78 @@ from PyQt6.QtWidgets import (
 )
 from qfluentwidgets import Dialog, ProgressRing, SearchLineEdit, SegmentedWidget, isDarkTheme
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from config.settings import get_settings_manager
 from core.i18n import _
 from core.symbol_search import SymbolInfo, get_symbol_search_service
+from core.utils import PAIR_RE
 
 logger = logging.getLogger(__name__)
 
+# Queries kept in each dialog's search cache before the oldest is evicted
+_SEARCH_CACHE_SIZE = 128
+# DexScreener results kept per dialog, and how long (seconds) they stay fresh
+_DEX_CACHE_SIZE = 16
+_DEX_CACHE_TTL = 60.0
+
+# EVM contract (0x + 40 hex) and Solana mint (base58, 32-44 chars) addresses
+_ETH_ADDR = re.compile(r"^0x[0-9a-fA-F]{40}$")
+_SOL_ADDR = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{32,44}$")
+
+_LIST_QSS_TEMPLATE = """
+    QListWidget {{
+        background-color: {bg_color};
+        border: 1px solid {border_color};
+        border-radius: 6px;
+        padding: 4px;
+        outline: none;
+    }}
+    QListWidget::item {{
+        color: {text_color};
+        padding: 8px 12px;
+        border-radius: 4px;
+        margin: 2px 0;
+    }}
+    QListWidget::item:hover {{
+        background-color: {hover_bg};
+    }}
+    QListWidget::item:selected {{
+        background-color: {selected_bg};
+        color: white;
+    }}
+"""
+
+# Result list stylesheets keyed by isDarkTheme(), formatted once at import
+_LIST_QSS = {
+    True: _LIST_QSS_TEMPLATE.format(
+        bg_color="#2d2d2d",
+        text_color="#ffffff",
+        hover_bg="#3d3d3d",
+        selected_bg="#0078d4",
+        border_color="#404040",
+    ),
+    False: _LIST_QSS_TEMPLATE.format(
+        bg_color="#ffffff",
+        text_color="#1a1a1a",
+        hover_bg="#f0f0f0",
+        selected_bg="#0078d4",
+        border_color="#e0e0e0",
+    ),
+}
+
+
+def _format_liquidity(liquidity: float) -> str:
+    """Format a USD liquidity figure as $1.2M, $3.4K or $56."""
+    if liquidity >= 1_000_000:
+        return f"${liquidity / 1_000_000:.1f}M"
+    if liquidity >= 1_000:
+        return f"${liquidity / 1_000:.1f}K"
+    return f"${liquidity:.0f}"
+
 
 class AddPairDialog(Dialog):
     def __init__(self, data_source: str = "OKX", parent: QWidget | None = None):
@@ -32,9 +100,21 @@ class AddPairDialog(Dialog):
         self._search_timer.setSingleShot(True)
         self._search_timer.timeout.connect(self._do_search)
         self._updating_from_selection = False
+        # Rows of results_list in use; rows past this are hidden and reused by later searches
+        self._result_rows = 0
+        # Normalized query -> results; dropped whenever the symbol list reloads
+        self._search_cache: OrderedDict[str, list[SymbolInfo]] = OrderedDict()
 
         self._dex_manager = QNetworkAccessManager(self)
         self._dex_manager.finished.connect(self._on_dex_response)
+        # Only the newest DEX request is kept; older ones are aborted and their replies ignored
+        self._current_dex_reply: QNetworkReply | None = None
+        self._dex_query = ""
+        # Query -> (time fetched, (display text, item id) rows)
+        self._dex_cache: OrderedDict[str, tuple[float, list[tuple[str, str]]]] = OrderedDict()
+        self._dex_timer = QTimer(self)
+        self._dex_timer.setSingleShot(True)
+        self._dex_timer.timeout.connect(self._do_dex_search)
 
         self._configure_proxy()
 
@@ -54,8 +134,27 @@ class AddPairDialog(Dialog):
         self._search_service.symbols_loaded.connect(self._on_symbols_loaded)
         self._search_service.loading_started.connect(self._on_loading_started)
         self._search_service.loading_error.connect(self._on_loading_error)
-
-        self._search_service.load_symbols(self._data_source)
+        # Symbols are requested on first show, not for dialogs that are never displayed
+        self._symbols_requested = False
+
+    def showEvent(self, event):
+        if not self._symbols_requested:
+            self._symbols_requested = True
+            self._search_service.load_symbols(self._data_source)
+        super().showEvent(event)
+
+    def done(self, result: int):
+        # The search service is shared, so a closed dialog must stop receiving its signals
+        for signal, slot in (
+            (self._search_service.symbols_loaded, self._on_symbols_loaded),
+            (self._search_service.loading_started, self._on_loading_started),
+            (self._search_service.loading_error, self._on_loading_error),
+        ):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass
+        super().done(result)
 
     def _configure_proxy(self):
         settings = get_settings_manager().settings
@@ -201,42 +300,16 @@ class AddPairDialog(Dialog):
         layout.addStretch()
 
     def _style_list_widget(self, widget: QListWidget):
-        is_dark = isDarkTheme()
-        bg_color = "#2d2d2d" if is_dark else "#ffffff"
-        text_color = "#ffffff" if is_dark else "#1a1a1a"
-        hover_bg = "#3d3d3d" if is_dark else "#f0f0f0"
-        selected_bg = "#0078d4" if is_dark else "#0078d4"
-        border_color = "#404040" if is_dark else "#e0e0e0"
-
-        widget.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {bg_color};
-                border: 1px solid {border_color};
-                border-radius: 6px;
-                padding: 4px;
-                outline: none;
-            }}
-            QListWidget::item {{
-                color: {text_color};
-                padding: 8px 12px;
-                border-radius: 4px;
-                margin: 2px 0;
-            }}
-            QListWidget::item:hover {{
-                background-color: {hover_bg};
-            }}
-            QListWidget::item:selected {{
-                background-color: {selected_bg};
-                color: white;
-            }}
-        """)
+        widget.setStyleSheet(_LIST_QSS[isDarkTheme()])
 
     def _on_loading_started(self):
         self.loading_spinner.setVisible(True)
         self.status_label.setText(_("Loading symbols..."))
         self.results_list.clear()
+        self._result_rows = 0
 
     def _on_symbols_loaded(self, symbols: list[SymbolInfo]):
+        self._search_cache.clear()
         self.loading_spinner.setVisible(False)
         self.status_label.setText(_("{count} symbols available").format(count=len(symbols)))
         self._do_search()
@@ -253,19 +326,28 @@ class AddPairDialog(Dialog):
         self._pair = None
         self.yesButton.setEnabled(False)
         self.error_label.setVisible(False)
-        self._search_timer.stop()
+        # start() restarts a running single-shot timer, which debounces typing
         self._search_timer.start(200)
 
     def _do_search(self):
         query = self.search_input.text().strip()
-        results = self._search_service.search(query, limit=50)
-        self.results_list.clear()
+        key = query.upper()
+        results = self._search_cache.get(key)
+        if results is None:
+            results = self._search_service.search(query, limit=50)
+            self._search_cache[key] = results
+            if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        else:
+            self._search_cache.move_to_end(key)
+        self._show_results(results)
 
         if not results:
             if query:
                 self.status_label.setText(_("No matching pairs found"))
-                if self._is_valid_format(query):
-                    self._pair = query.upper()
+                # key is the query already stripped and upper-cased
+                if PAIR_RE.match(key):
+                    self._pair = key
                     self.yesButton.setEnabled(True)
                     self.status_label.setText(
                         _("No match found. Add '{pair}' anyway?").format(pair=self._pair)
@@ -274,34 +356,58 @@ class AddPairDialog(Dialog):
                 self.status_label.setText(_("Enter a symbol to search"))
             return
 
-        for symbol_info in results:
-            item = QListWidgetItem(symbol_info.symbol)
+        self.status_label.setText(_("Found {count} matches").format(count=len(results)))
+
+    def _show_results(self, results: list[SymbolInfo]):
+        """Fill the result list, rewriting existing rows instead of recreating them."""
+        results_list = self.results_list
+        results_list.setUpdatesEnabled(False)
+        results_list.clearSelection()
+        results_list.setCurrentRow(-1)
+
+        for row, symbol_info in enumerate(results):
+            if row < results_list.count():
+                item = results_list.item(row)
+                item.setText(symbol_info.symbol)
+                results_list.setRowHidden(row, False)
+            else:
+                item = QListWidgetItem(symbol_info.symbol)
+                results_list.addItem(item)
             item.setData(Qt.ItemDataRole.UserRole, symbol_info)
-            self.results_list.addItem(item)
 
-        self.status_label.setText(_("Found {count} matches").format(count=len(results)))
+        for row in range(len(results), self._result_rows):
+            results_list.setRowHidden(row, True)
+        self._result_rows = len(results)
+        results_list.setUpdatesEnabled(True)
 
     def _on_dex_text_changed(self, text: str):
         """Handle DEX input text changes for auto-search"""
         self._pair = None
         self.yesButton.setEnabled(False)
+        self._dex_timer.start(300)
 
     def _is_contract_address(self, text: str) -> bool:
         """Check if the input looks like a contract address"""
         text = text.strip()
-        # Ethereum-like address (0x...)
-        if text.startswith("0x") and len(text) == 42:
-            return True
-        # Solana address (base58, typically 32-44 chars)
-        if len(text) >= 32 and not text.startswith("0x"):
-            return True
-        return False
+        return bool(_ETH_ADDR.match(text) or _SOL_ADDR.match(text))
 
     def _do_dex_search(self):
+        self._dex_timer.stop()
+        reply, self._current_dex_reply = self._current_dex_reply, None
+        if reply is not None:
+            reply.abort()
+            self.dex_spinner.setVisible(False)
+
         query = self.dex_input.text().strip()
         if not query:
             return
 
+        entry = self._dex_cache.get(query)
+        if entry is not None and time.monotonic() - entry[0] < _DEX_CACHE_TTL:
+            self._dex_cache.move_to_end(query)
+            self._show_dex_results(query, entry[1])
+            return
+
         logger.debug(f"Starting DEX search for: {query}")
         self.dex_spinner.setVisible(True)
         self.dex_results.clear()
@@ -313,15 +419,23 @@ class AddPairDialog(Dialog):
             url = f"https://api.dexscreener.com/latest/dex/tokens/{query}"
             logger.debug(f"Address search: {url}")
         else:
-            # Name search - use /search endpoint
-            url = f"https://api.dexscreener.com/latest/dex/search?q={query}"
+            # Name search - use /search endpoint, with the query percent-encoded
+            # so "&", "#" and "+" reach the API literally
+            q = QUrl.toPercentEncoding(query).data().decode()
+            url = f"https://api.dexscreener.com/latest/dex/search?q={q}"
             logger.debug(f"Name search: {url}")
 
         req = QNetworkRequest(QUrl(url))
         req.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, "Mozilla/5.0")
-        self._dex_manager.get(req)
+        self._current_dex_reply = self._dex_manager.get(req)
+        self._dex_query = query
 
     def _on_dex_response(self, reply: QNetworkReply):
+        if reply is not self._current_dex_reply:
+            # Aborted or superseded by a newer search
+            reply.deleteLater()
+            return
+        self._current_dex_reply = None
         self.dex_spinner.setVisible(False)
 
         err = reply.error()
@@ -333,66 +447,43 @@ class AddPairDialog(Dialog):
             return
 
         try:
-            raw_data = bytes(reply.readAll())
-            data = json.loads(raw_data)
+            data = _json_loads(reply.readAll().data())
 
             # Handle both /tokens and /search API responses
-            pairs = data.get("pairs", [])
-
-            if not pairs:
-                logger.debug("No pairs found in response")
-                self.dex_status.setText(
-                    _("No tokens found matching '{query}'").format(
-                        query=self.dex_input.text().strip()
-                    )
-                )
-                return
+            pairs = data.get("pairs") or []
+
+            # Keep the most liquid pair of each token, then the 30 most liquid tokens;
+            # equal liquidity keeps API order
+            best: dict[str, tuple[float, int, dict]] = {}
+            for index, p in enumerate(pairs):
+                base_token = p.get("baseToken", {})
+                key = f"{p.get('chainId')}:{base_token.get('symbol')}:{base_token.get('address')}"
+                liquidity = float(p.get("liquidity", {}).get("usd", 0) or 0)
+                if key not in best or liquidity > best[key][0]:
+                    best[key] = (liquidity, -index, p)
+            top = heapq.nlargest(30, best.values(), key=lambda entry: entry[:2])
 
-            seen_keys = set()
             display_items = []
-
-            # Sort by liquidity (highest first)
-            pairs.sort(key=lambda x: float(x.get("liquidity", {}).get("usd", 0) or 0), reverse=True)
-
-            for p in pairs:
+            for liquidity, _index, p in top:
                 chain = p.get("chainId")
-                base = p.get("baseToken", {}).get("symbol")
-                base_name = p.get("baseToken", {}).get("name", "")
+                base_token = p.get("baseToken", {})
+                base = base_token.get("symbol")
+                addr = base_token.get("address")
                 quote = p.get("quoteToken", {}).get("symbol")
-                addr = p.get("baseToken", {}).get("address")
-                liquidity = float(p.get("liquidity", {}).get("usd", 0) or 0)
-
-                # Create unique key to avoid duplicates
-                key = f"{chain}:{base}:{addr}"
-                if key in seen_keys:
-                    continue
-                seen_keys.add(key)
 
                 # Format display string with name, chain, and liquidity
-                if liquidity >= 1000000:
-                    liq_str = f"${liquidity / 1000000:.1f}M"
-                elif liquidity >= 1000:
-                    liq_str = f"${liquidity / 1000:.1f}K"
-                else:
-                    liq_str = f"${liquidity:.0f}"
-
-                display = f"{base}/{quote} - {base_name} ({chain}) [{liq_str}]"
+                display = (
+                    f"{base}/{quote} - {base_token.get('name', '')} ({chain}) "
+                    f"[{_format_liquidity(liquidity)}]"
+                )
                 item_id = f"chain:{chain}:{addr}:{base}"
 
                 display_items.append((display, item_id))
 
-                # Limit to 30 results to avoid overwhelming the UI
-                if len(display_items) >= 30:
-                    break
-
-            for display, pid in display_items:
-                item = QListWidgetItem(display)
-                item.setData(Qt.ItemDataRole.UserRole, pid)
-                self.dex_results.addItem(item)
-
-            count = len(display_items)
-            logger.debug(f"Found {count} pairs")
-            self.dex_status.setText(_("Found {count} pairs").format(count=count))
+            self._dex_cache[self._dex_query] = (time.monotonic(), display_items)
+            if len(self._dex_cache) > _DEX_CACHE_SIZE:
+                self._dex_cache.popitem(last=False)
+            self._show_dex_results(self._dex_query, display_items)
 
         except Exception as e:
             logger.error(f"Error parsing DEX response: {e}", exc_info=True)
@@ -400,10 +491,26 @@ class AddPairDialog(Dialog):
 
         reply.deleteLater()
 
-    def _is_valid_format(self, text: str) -> bool:
-        text = text.strip().upper()
-        pattern = r"^[A-Z0-9]+-[A-Z0-9]+$"
-        return bool(re.match(pattern, text))
+    def _show_dex_results(self, query: str, display_items: list[tuple[str, str]]):
+        self.dex_results.setUpdatesEnabled(False)
+        self.dex_results.clear()
+        for display, pid in display_items:
+            item = QListWidgetItem(display)
+            item.setData(Qt.ItemDataRole.UserRole, pid)
+            self.dex_results.addItem(item)
+        self.dex_results.setUpdatesEnabled(True)
+
+        count = len(display_items)
+        logger.debug(f"Found {count} pairs")
+        if count:
+            self.dex_status.setText(_("Found {count} pairs").format(count=count))
+        else:
+            self.dex_status.setText(_("No tokens found matching '{query}'").format(query=query))
+
+    def _normalize_pair(self, text: str) -> str | None:
+        """Return text as an upper-case BASE-QUOTE pair, or None if it is not one."""
+        pair = text.strip().upper()
+        return pair if PAIR_RE.match(pair) else None
 
     def _on_item_clicked(self, item: QListWidgetItem):
         symbol_info: SymbolInfo = item.data(Qt.ItemDataRole.UserRole)
@@ -422,14 +529,14 @@ class AddPairDialog(Dialog):
             self.yesButton.setEnabled(True)
 
     def _on_item_double_clicked(self, item: QListWidgetItem):
-        if self.segment.currentItem() == "cex":
+        if self.segment.currentRouteKey() == "cex":
             self._on_item_clicked(item)
         else:
             self._on_dex_item_clicked(item)
         self._on_confirm()
 
     def _on_return_pressed(self):
-        if self.segment.currentItem() == "dex":
+        if self.segment.currentRouteKey() == "dex":
             self._do_dex_search()
             return
 
@@ -439,15 +546,15 @@ class AddPairDialog(Dialog):
             self._on_confirm()
             return
 
-        if self.results_list.count() == 1:
+        if self._result_rows == 1:
             item = self.results_list.item(0)
             self._on_item_clicked(item)
             self._on_confirm()
             return
 
-        text = self.search_input.text().strip().upper()
-        if self._is_valid_format(text):
-            self._pair = text
+        pair = self._normalize_pair(self.search_input.text())
+        if pair:
+            self._pair = pair
             self._on_confirm()
 
     def _on_confirm(self):
@@ -459,13 +566,18 @@ class AddPairDialog(Dialog):
 
     def keyPressEvent(self, event):
         key = event.key()
-        active_list = self.results_list if self.segment.currentItem() == "cex" else self.dex_results
+        if self.segment.currentRouteKey() == "cex":
+            active_list = self.results_list
+            row_count = self._result_rows
+        else:
+            active_list = self.dex_results
+            row_count = active_list.count()
 
         if key == Qt.Key.Key_Down:
             current = active_list.currentRow()
-            if current < active_list.count() - 1:
+            if current < row_count - 1:
                 active_list.setCurrentRow(current + 1)
-            elif current == -1 and active_list.count() > 0:
+            elif current == -1 and row_count > 0:
                 active_list.setCurrentRow(0)
             event.accept()
             return
@@ -482,6 +594,8 @@ class AddPairDialog(Dialog):
     @staticmethod
     def get_new_pair(data_source: str = "OKX", parent: QWidget | None = None) -> str | None:
         dialog = AddPairDialog(data_source, parent)
-        if dialog.exec():
+        accepted = dialog.exec()
+        dialog.deleteLater()
+        if accepted:
             return dialog.get_pair()
         return None
@@ -120,15 +120,7 @@ class AlertSettingCard(ExpandGroupSettingCard):
         self.sound_combo = ComboBox()
         self.sound_combo.addItems([_("Off"), _("System Sound"), _("Chime")])
         self.sound_combo.setMinimumWidth(150)
-
-        mode = self._settings_manager.settings.sound_mode
-        if mode == "system":
-            self.sound_combo.setCurrentIndex(1)
-        elif mode == "chime":
-            self.sound_combo.setCurrentIndex(2)
-        else:
-            self.sound_combo.setCurrentIndex(0)
-
+        self._load_sound_mode()
         self.sound_combo.currentTextChanged.connect(self._on_sound_mode_changed)
 
         sound_layout.addWidget(self.sound_label)
@@ -172,6 +164,14 @@ class AlertSettingCard(ExpandGroupSettingCard):
 
         self._update_clear_button()
 
+    def _load_sound_mode(self):
+        mode = self._settings_manager.settings.sound_mode
+        index = {"system": 1, "chime": 2}.get(mode, 0)
+        # Syncing from settings must not write the same mode back
+        self.sound_combo.blockSignals(True)
+        self.sound_combo.setCurrentIndex(index)
+        self.sound_combo.blockSignals(False)
+
     def _add_alert_item(self, alert: PriceAlert):
         from PyQt6.QtWidgets import QListWidgetItem
 
@@ -251,3 +251,4 @@ class AlertSettingCard(ExpandGroupSettingCard):
 
     def refresh(self):
         self._load_alerts()
+        self._load_sound_mode()
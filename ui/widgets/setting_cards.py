@@ -26,6 +26,12 @@ from .add_pair_dialog import AddPairDialog
 from .proxy_form import ProxyForm
 
 
+def _set_switch_checked(switch: SwitchButton, checked: bool):
+    """Update a switch only when its state differs; SwitchButton relabels itself on every call."""
+    if switch.isChecked() != checked:
+        switch.setChecked(checked)
+
+
 class ProxySettingCard(ExpandGroupSettingCard):
     """Expandable setting card for proxy configuration."""
 
@@ -57,8 +63,6 @@ class ProxySettingCard(ExpandGroupSettingCard):
         switch_layout = QHBoxLayout(switch_container)
         switch_layout.setContentsMargins(0, 0, 0, 0)
 
-        from qfluentwidgets import BodyLabel
-
         self.enable_label = BodyLabel(_("Enable Proxy"))
         self.enable_switch = SwitchButton()
         self.enable_switch.setOffText(_("Off"))
@@ -110,7 +114,7 @@ class ProxySettingCard(ExpandGroupSettingCard):
 
     def set_proxy_config(self, config: ProxyConfig):
         """Set proxy configuration."""
-        self.enable_switch.setChecked(config.enabled)
+        _set_switch_checked(self.enable_switch, config.enabled)
         self.proxy_form.set_values(
             {
                 "type": config.type,
@@ -671,7 +675,7 @@ class DisplaySettingCard(ExpandGroupSettingCard):
 
     def set_dynamic_background(self, enabled: bool):
         """Set dynamic background state."""
-        self.bg_switch.setChecked(enabled)
+        _set_switch_checked(self.bg_switch, enabled)
 
     def get_dynamic_background(self) -> bool:
         """Get current dynamic background state."""
@@ -688,7 +692,7 @@ class DisplaySettingCard(ExpandGroupSettingCard):
 
     def set_auto_scroll(self, enabled: bool, interval: int):
         """Set auto scroll settings."""
-        self.scroll_switch.setChecked(enabled)
+        _set_switch_checked(self.scroll_switch, enabled)
         self.interval_spin.setValue(interval)
         self.interval_spin.setEnabled(enabled)
 
@@ -698,7 +702,7 @@ class DisplaySettingCard(ExpandGroupSettingCard):
 
     def set_minimalist_view(self, enabled: bool):
         """Set minimalist view state."""
-        self.mini_switch.setChecked(enabled)
+        _set_switch_checked(self.mini_switch, enabled)
 
     def get_minimalist_view(self) -> bool:
         """Get current minimalist view state."""
@@ -866,9 +870,9 @@ class HoverSettingCard(ExpandGroupSettingCard):
         cache_ttl: int = 60,
     ):
         """Set all values."""
-        self.master_switch.setChecked(enabled)
-        self.stats_switch.setChecked(show_stats)
-        self.chart_switch.setChecked(show_chart)
+        _set_switch_checked(self.master_switch, enabled)
+        _set_switch_checked(self.stats_switch, show_stats)
+        _set_switch_checked(self.chart_switch, show_chart)
         self.period_combo.setCurrentText(period)
         self.cache_spin.setValue(cache_ttl)
 